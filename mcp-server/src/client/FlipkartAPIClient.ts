@@ -5,8 +5,11 @@
  * Supports persistent authentication across sessions
  */
 
+import http from 'http';
+import https from 'https';
 import axios, { AxiosInstance, AxiosError } from 'axios';
 import { logger } from '../utils/logger.js';
+import { TtlCache } from '../utils/cache.js';
 import { saveAuth, loadAuth, clearAuth } from '../utils/tokenStorage.js';
 import type {
   ApiResponse,
@@ -19,6 +22,10 @@ import type {
   LocationValidationResponse,
   CodEligibilityResponse,
   CreateOrderResponse,
+  Order,
+  OrderStatusResponse,
+  OrderHistoryResponse,
+  OrderHistoryPageResponse,
   PaymentResponse,
   Address,
   Product,
@@ -31,45 +38,176 @@ import type {
   OrderHistoryAnalysis,
 } from '../types/index.js';
 
+// Connection pool limits for the keep-alive agents
+const MAX_SOCKETS = 100;
+const MAX_FREE_SOCKETS = 20;
+
+// Idle keep-alive window; long enough to span user think-time between tool calls.
+// Must stay below the backend's keepAliveTimeout (75s) so we never reuse a socket
+// the server is already closing
+const KEEP_ALIVE_SECS = Number(process.env.FLIPKART_API_KEEPALIVE_SECS) || 70;
+
+// Abort oversized responses while streaming instead of buffering them in full
+const MAX_RESPONSE_BYTES = 5 * 1024 * 1024;
+
+// Product details are reused across search -> add-to-cart -> alternatives lookups
+const PRODUCT_CACHE_TTL_MS = 30 * 1000;
+
+// Repeated searches (recipes, suggestions) commonly hit the same queries
+const SEARCH_CACHE_TTL_MS = 60 * 1000;
+const SEARCH_CACHE_MAX_ENTRIES = 256;
+
+// Saved addresses are managed in the web app and rarely change mid-conversation
+const ADDRESS_CACHE_TTL_MS = 60 * 1000;
+
+// Order statuses also progress server-side (and via the web app and scheduler),
+// so history is only reused across the back-to-back calls of a single turn
+const ORDER_HISTORY_CACHE_TTL_MS = 15 * 1000;
+
+// Largest page the backend serves for /api/orders (PAGINATION.MAX_LIMIT)
+const ORDER_HISTORY_PAGE_SIZE = 100;
+
+// Health checks are opportunistic, so fail fast
+const HEALTH_CHECK_TIMEOUT_MS = 1500;
+
+// After this many consecutive connection failures, fail calls fast for a cooldown
+// instead of letting every tool wait out its own connect timeout
+const CIRCUIT_FAILURE_THRESHOLD = 3;
+const CIRCUIT_COOLDOWN_MS = 5 * 1000;
+// Only errors that mean the backend could not be reached count towards opening it.
+// ECONNABORTED is axios's request timeout code, so a startup checkHealth() slower
+// than its 1.5s deadline also counts as a failure
+const CIRCUIT_FAILURE_CODES = new Set([
+  'ECONNREFUSED',
+  'ECONNRESET',
+  'ETIMEDOUT',
+  'ECONNABORTED',
+  'ENOTFOUND',
+  'EAI_AGAIN',
+  'EHOSTUNREACH',
+  'ENETUNREACH',
+]);
+
+/**
+ * Raised without a network attempt while the backend circuit is open
+ */
+class CircuitOpenError extends Error {
+  constructor() {
+    super('Flipkart API is unavailable (circuit open), try again in a few seconds');
+    this.name = 'CircuitOpenError';
+  }
+}
+
+// Process-wide keep-alive agents, created on first use and shared by every client
+// instance so all backend calls draw from a single connection pool
+let sharedAgents: { http: http.Agent; https: https.Agent } | null = null;
+
+function getSharedAgents(): { http: http.Agent; https: https.Agent } {
+  if (!sharedAgents) {
+    const agentOptions = {
+      keepAlive: true,
+      maxSockets: MAX_SOCKETS,
+      maxFreeSockets: MAX_FREE_SOCKETS,
+      timeout: KEEP_ALIVE_SECS * 1000,
+    };
+    sharedAgents = {
+      http: new http.Agent(agentOptions),
+      https: new https.Agent(agentOptions),
+    };
+  }
+  return sharedAgents;
+}
+
 export class FlipkartAPIClient {
   private client: AxiosInstance;
   private sessionToken: string | null = null;
   private activeAddressId: string | null = null;
   private currentUser: { id: string; name: string; email: string } | null = null;
   private initialized: boolean = false;
+  private productCache = new TtlCache<string, Product>(PRODUCT_CACHE_TTL_MS);
+  private searchCache = new TtlCache<string, SearchResponse>(SEARCH_CACHE_TTL_MS, SEARCH_CACHE_MAX_ENTRIES);
+  // Keyed by session token so cached history never leaks across accounts
+  private orderHistoryCache = new TtlCache<string, OrderHistoryResponse>(ORDER_HISTORY_CACHE_TTL_MS);
+  private orderAnalysisCache = new TtlCache<string, { analysis: OrderHistoryAnalysis }>(ORDER_HISTORY_CACHE_TTL_MS);
+  private addressCache = new TtlCache<string, { addresses: Address[] }>(ADDRESS_CACHE_TTL_MS);
+  // Read requests currently on the wire, so identical concurrent calls share one round-trip
+  private inflight: Map<string, Promise<unknown>> = new Map();
+  // Bumped on every order cache invalidation so fetches started before it neither
+  // repopulate the cache nor get joined by later callers
+  private orderCacheGeneration: number = 0;
+  // Circuit breaker: closed while circuitOpenUntil is 0, open until that time,
+  // then half-open with a single probe request allowed through
+  private consecutiveFailures: number = 0;
+  private circuitOpenUntil: number = 0;
+  private probeInFlight: boolean = false;
 
   constructor(baseUrl?: string) {
     const apiUrl = baseUrl || process.env.FLIPKART_API_URL || 'http://localhost:5000';
+
+    // Reuse TCP connections across tool calls instead of a new handshake per request
+    const agents = getSharedAgents();
     
     this.client = axios.create({
       baseURL: apiUrl,
       timeout: 30000,
+      httpAgent: agents.http,
+      httpsAgent: agents.https,
+      maxContentLength: MAX_RESPONSE_BYTES,
       headers: {
         'Content-Type': 'application/json',
       },
     });
 
-    // Request interceptor for logging and auth
+    // Request interceptor for logging - auth is a default header, so with
+    // debug logging off nothing needs to run per request
+    if (logger.isEnabled('debug')) {
+      this.client.interceptors.request.use((config) => {
+        logger.apiRequest(config.method?.toUpperCase() || 'GET', config.url || '', config.data);
+        return config;
+      });
+    }
+
+    // Request interceptor for the circuit breaker - registered last so axios runs it
+    // first, rejecting before any logging or network attempt
     this.client.interceptors.request.use((config) => {
-      if (this.sessionToken) {
-        config.headers.Authorization = `Bearer ${this.sessionToken}`;
+      if (this.circuitOpenUntil) {
+        if (Date.now() < this.circuitOpenUntil || this.probeInFlight) {
+          throw new CircuitOpenError();
+        }
+        this.probeInFlight = true;
       }
-      logger.apiRequest(config.method?.toUpperCase() || 'GET', config.url || '', config.data);
       return config;
     });
 
-    // Response interceptor for logging
+    // Response interceptor for logging and circuit breaker bookkeeping
     this.client.interceptors.response.use(
       (response) => {
-        logger.apiResponse(
-          response.config.method?.toUpperCase() || 'GET',
-          response.config.url || '',
-          response.status,
-          response.data
-        );
+        this.recordBackendReachable();
+        // axios rejects 4xx/5xx, so successful responses only ever log at debug
+        if (logger.isEnabled('debug')) {
+          logger.apiResponse(
+            response.config.method?.toUpperCase() || 'GET',
+            response.config.url || '',
+            response.status,
+            response.data
+          );
+        }
         return response;
       },
       (error: AxiosError) => {
+        if (error instanceof CircuitOpenError) throw error;
+
+        // An HTTP error response still proves the backend is up; cancellations and
+        // oversized responses say nothing about reachability
+        if (error.response) {
+          this.recordBackendReachable();
+        } else if (error.code && CIRCUIT_FAILURE_CODES.has(error.code)) {
+          this.recordBackendFailure();
+        } else {
+          // Inconclusive probe - let the next request probe instead
+          this.probeInFlight = false;
+        }
+
         const url = error.config?.url || '';
         const method = error.config?.method?.toUpperCase() || 'GET';
         const responseData = error.response?.data;
@@ -85,6 +223,43 @@ export class FlipkartAPIClient {
     this.initializeFromStorage();
   }
 
+  /**
+   * Close the circuit after any response from the backend
+   */
+  private recordBackendReachable(): void {
+    this.consecutiveFailures = 0;
+    this.circuitOpenUntil = 0;
+    this.probeInFlight = false;
+  }
+
+  /**
+   * Count a connection failure or timeout, opening the circuit at the threshold
+   * A failed half-open probe reopens it for another cooldown
+   */
+  private recordBackendFailure(): void {
+    this.consecutiveFailures++;
+    const probeFailed = this.probeInFlight;
+    this.probeInFlight = false;
+
+    if (probeFailed || this.consecutiveFailures >= CIRCUIT_FAILURE_THRESHOLD) {
+      this.circuitOpenUntil = Date.now() + CIRCUIT_COOLDOWN_MS;
+      logger.warn(`Flipkart API unreachable after ${this.consecutiveFailures} attempts, failing fast for ${CIRCUIT_COOLDOWN_MS / 1000}s`);
+    }
+  }
+
+  /**
+   * Store the session token and install it as the default Authorization header
+   * Done once per token change rather than on every request
+   */
+  private applySessionToken(token: string | null): void {
+    this.sessionToken = token;
+    if (token) {
+      this.client.defaults.headers.common.Authorization = `Bearer ${token}`;
+    } else {
+      delete this.client.defaults.headers.common.Authorization;
+    }
+  }
+
   /**
    * Initialize client from persisted storage
    * Called automatically on construction
@@ -95,7 +270,7 @@ export class FlipkartAPIClient {
     try {
       const storedAuth = loadAuth();
       if (storedAuth) {
-        this.sessionToken = storedAuth.token;
+        this.applySessionToken(storedAuth.token);
         this.currentUser = storedAuth.user;
         logger.info(`Restored session for ${storedAuth.user.email} from storage`);
       }
@@ -131,13 +306,37 @@ export class FlipkartAPIClient {
    * Clear persisted auth (logout)
    */
   logout(): void {
-    this.sessionToken = null;
+    this.applySessionToken(null);
     this.currentUser = null;
     this.activeAddressId = null;
     clearAuth();
     logger.info('Logged out and cleared persisted auth');
   }
 
+  /**
+   * Close pooled connections (on server shutdown)
+   */
+  close(): void {
+    if (sharedAgents) {
+      sharedAgents.http.destroy();
+      sharedAgents.https.destroy();
+      sharedAgents = null;
+    }
+  }
+
+  /**
+   * Check whether the backend is reachable
+   * Uses a short deadline so a hung backend cannot stall the caller
+   */
+  async checkHealth(): Promise<boolean> {
+    try {
+      await this.client.get('/api/health', { timeout: HEALTH_CHECK_TIMEOUT_MS });
+      return true;
+    } catch {
+      return false;
+    }
+  }
+
   /**
    * Check if user is authenticated
    */
@@ -158,7 +357,7 @@ export class FlipkartAPIClient {
    * Optionally persist with user info
    */
   setSessionToken(token: string | null, user?: { id: string; name: string; email: string }): void {
-    this.sessionToken = token;
+    this.applySessionToken(token);
     
     if (token && user) {
       this.persistAuth(user);
@@ -182,6 +381,29 @@ export class FlipkartAPIClient {
     this.activeAddressId = addressId;
   }
 
+  /**
+   * Share one in-flight request between identical concurrent read calls
+   * The key is scoped to the session token so accounts never share a response
+   */
+  private dedupe<T>(key: string, fetcher: () => Promise<T>): Promise<T> {
+    const inflightKey = `${this.sessionToken || ''}:${key}`;
+    const pending = this.inflight.get(inflightKey);
+    if (pending) return pending as Promise<T>;
+
+    const request = fetcher().finally(() => this.inflight.delete(inflightKey));
+    this.inflight.set(inflightKey, request);
+    return request;
+  }
+
+  /**
+   * Drop cached order history after anything that creates or changes an order
+   */
+  private invalidateOrderCaches(): void {
+    this.orderCacheGeneration++;
+    this.orderHistoryCache.clear();
+    this.orderAnalysisCache.clear();
+  }
+
   // ============================================
   // Auth APIs
   // ============================================
@@ -197,7 +419,7 @@ export class FlipkartAPIClient {
     });
 
     if (response.data.success && response.data.data.token) {
-      this.sessionToken = response.data.data.token;
+      this.applySessionToken(response.data.data.token);
       
       // Persist auth for future sessions
       const user = response.data.data.user;
@@ -230,22 +452,47 @@ export class FlipkartAPIClient {
 
   /**
    * Smart search with weighted scoring and variant detection
+   * Results are cached briefly per normalized query
    */
   async smartSearch(query: string): Promise<SearchResponse> {
+    const cacheKey = query.trim().toLowerCase();
+    const cached = this.searchCache.get(cacheKey);
+    if (cached) return cached;
+
     const response = await this.client.get<ApiResponse<SearchResponse>>('/api/products/smart-search', {
       params: { q: query },
     });
+
+    for (const product of response.data.data.products) {
+      this.productCache.set(product._id, product);
+    }
+    this.searchCache.set(cacheKey, response.data.data);
+
     return response.data.data;
   }
 
   /**
    * Get product by ID
+   * Served from the product cache when recently searched or fetched
    */
   async getProduct(productId: string): Promise<{ product: Product }> {
+    const cached = this.productCache.get(productId);
+    if (cached) {
+      return { product: cached };
+    }
+
     const response = await this.client.get<ApiResponse<{ product: Product }>>(`/api/products/${productId}`);
+    this.productCache.set(productId, response.data.data.product);
     return response.data.data;
   }
 
+  /**
+   * Get a product from the cache without a network request
+   */
+  getCachedProduct(productId: string): Product | undefined {
+    return this.productCache.get(productId);
+  }
+
   /**
    * Get alternative products for out-of-stock item
    */
@@ -282,6 +529,8 @@ export class FlipkartAPIClient {
       productId,
       quantity,
     });
+    // Stock may have moved since the product was cached
+    this.productCache.delete(productId);
     return response.data.data;
   }
 
@@ -334,11 +583,29 @@ export class FlipkartAPIClient {
   // ============================================
 
   /**
-   * Get all user addresses
+   * Get all user addresses (cached per session)
    */
   async getAddresses(): Promise<{ addresses: Address[] }> {
-    const response = await this.client.get<ApiResponse<{ addresses: Address[] }>>('/api/addresses');
-    return response.data.data;
+    const cacheKey = this.sessionToken || '';
+    const cached = this.addressCache.get(cacheKey);
+    if (cached) return cached;
+
+    return this.dedupe('addresses', async () => {
+      const response = await this.client.get<ApiResponse<{ addresses: Address[] }>>('/api/addresses');
+      this.addressCache.set(cacheKey, response.data.data);
+      return response.data.data;
+    });
+  }
+
+  /**
+   * Warm the address cache in the background (fire-and-forget)
+   * Checkout, which needs the address list, usually follows a cart change
+   * A get_addresses call made while this is running joins the same request
+   */
+  prefetchAddresses(): void {
+    this.getAddresses().catch((error) => {
+      logger.debug(`Address prefetch failed: ${error instanceof Error ? error.message : String(error)}`);
+    });
   }
 
   /**
@@ -396,8 +663,10 @@ export class FlipkartAPIClient {
    * Check COD eligibility
    */
   async checkCodEligibility(addressId?: string): Promise<CodEligibilityResponse> {
-    const params = addressId ? { addressId } : {};
-    const response = await this.client.get<ApiResponse<CodEligibilityResponse>>('/api/checkout/cod-eligibility', { params });
+    // axios drops undefined params, so no conditional object is needed
+    const response = await this.client.get<ApiResponse<CodEligibilityResponse>>('/api/checkout/cod-eligibility', {
+      params: { addressId },
+    });
     return response.data.data;
   }
 
@@ -408,6 +677,9 @@ export class FlipkartAPIClient {
     const response = await this.client.post<ApiResponse<CreateOrderResponse>>('/api/checkout', {
       addressId,
     });
+    // Placing an order decrements stock on every ordered product
+    this.productCache.clear();
+    this.invalidateOrderCaches();
     return response.data.data;
   }
 
@@ -430,22 +702,77 @@ export class FlipkartAPIClient {
    */
   async processPayment(orderId: string): Promise<PaymentResponse> {
     const response = await this.client.post<ApiResponse<PaymentResponse>>(`/api/orders/${orderId}/pay`);
+    this.invalidateOrderCaches();
     return response.data.data;
   }
 
   /**
    * Get order details
    */
-  async getOrder(orderId: string): Promise<{ order: { _id: string; orderNumber: string; orderStatus: string; paymentStatus: string; totalAmount: number } }> {
-    const response = await this.client.get<ApiResponse<{ order: { _id: string; orderNumber: string; orderStatus: string; paymentStatus: string; totalAmount: number } }>>(`/api/orders/${orderId}`);
-    return response.data.data;
+  async getOrder(orderId: string): Promise<{ order: Order }> {
+    return this.dedupe(`order:${orderId}`, async () => {
+      const response = await this.client.get<ApiResponse<{ order: Order }>>(`/api/orders/${orderId}`);
+      return response.data.data;
+    });
+  }
+
+  /**
+   * Get order delivery status and status history
+   */
+  async getOrderStatus(orderId: string): Promise<OrderStatusResponse> {
+    return this.dedupe(`order-status:${orderId}`, async () => {
+      const response = await this.client.get<ApiResponse<OrderStatusResponse>>(`/api/orders/${orderId}/status`);
+      const status = response.data.data;
+
+      // Keep get_order_history / get_last_order consistent with what was just tracked
+      for (const history of this.orderHistoryCache.values()) {
+        if (history.orders.some(order => order._id === orderId && order.orderStatus !== status.currentStatus)) {
+          this.invalidateOrderCaches();
+          break;
+        }
+      }
+
+      return status;
+    });
+  }
+
+  /**
+   * Get the most recent orders (cached per session and limit)
+   * The backend applies the limit, so only the orders asked for are transferred.
+   * Limits above one backend page fetch the first page, then the remaining
+   * pages it reports concurrently.
+   */
+  async getOrderHistory(limit: number = 10): Promise<OrderHistoryResponse> {
+    const cacheKey = `${this.sessionToken || ''}:${limit}`;
+    const cached = this.orderHistoryCache.get(cacheKey);
+    if (cached) return cached;
+
+    const generation = this.orderCacheGeneration;
+    return this.dedupe(`order-history:${generation}:${limit}`, async () => {
+      const pageSize = Math.min(limit, ORDER_HISTORY_PAGE_SIZE);
+      const firstPage = await this.getOrderHistoryPage(1, pageSize);
+      const pageCount = Math.min(firstPage.pagination.pages, Math.ceil(limit / pageSize));
+
+      const remainingPages = await Promise.all(
+        Array.from({ length: Math.max(pageCount - 1, 0) }, (_, i) => this.getOrderHistoryPage(i + 2, pageSize))
+      );
+      const orders = firstPage.orders.concat(...remainingPages.map(page => page.orders)).slice(0, limit);
+
+      const result = { orders };
+      if (generation === this.orderCacheGeneration) {
+        this.orderHistoryCache.set(cacheKey, result);
+      }
+      return result;
+    });
   }
 
   /**
-   * Get order history
+   * Fetch a single page of order history
    */
-  async getOrderHistory(): Promise<{ orders: Array<{ _id: string; orderNumber: string; orderStatus: string; totalAmount: number; createdAt: string }> }> {
-    const response = await this.client.get<ApiResponse<{ orders: Array<{ _id: string; orderNumber: string; orderStatus: string; totalAmount: number; createdAt: string }> }>>('/api/orders');
+  private async getOrderHistoryPage(page: number, limit: number): Promise<OrderHistoryPageResponse> {
+    const response = await this.client.get<ApiResponse<OrderHistoryPageResponse>>('/api/orders', {
+      params: { page, limit },
+    });
     return response.data.data;
   }
 
@@ -485,8 +812,9 @@ export class FlipkartAPIClient {
    * Get frequent items (derived from order history)
    */
   async getFrequentItems(limit?: number): Promise<FrequentItemsResponse> {
-    const params = limit ? { limit } : {};
-    const response = await this.client.get<ApiResponse<FrequentItemsResponse>>('/api/preferences/frequent-items', { params });
+    const response = await this.client.get<ApiResponse<FrequentItemsResponse>>('/api/preferences/frequent-items', {
+      params: { limit },
+    });
     return response.data.data;
   }
 
@@ -536,6 +864,7 @@ export class FlipkartAPIClient {
    */
   async executeScheduledOrder(orderId: string): Promise<{ order: { orderId: string; orderNumber: string } }> {
     const response = await this.client.post<ApiResponse<{ order: { orderId: string; orderNumber: string } }>>(`/api/scheduled-orders/${orderId}/execute`);
+    this.invalidateOrderCaches();
     return response.data.data;
   }
 
@@ -544,18 +873,28 @@ export class FlipkartAPIClient {
   // ============================================
 
   /**
-   * Get order history analysis
+   * Get order history analysis (cached per session)
    */
   async getOrderAnalysis(): Promise<{ analysis: OrderHistoryAnalysis }> {
-    const response = await this.client.get<ApiResponse<{ analysis: OrderHistoryAnalysis }>>('/api/orders/analysis');
-    return response.data.data;
+    const cacheKey = this.sessionToken || '';
+    const cached = this.orderAnalysisCache.get(cacheKey);
+    if (cached) return cached;
+
+    const generation = this.orderCacheGeneration;
+    return this.dedupe(`order-analysis:${generation}`, async () => {
+      const response = await this.client.get<ApiResponse<{ analysis: OrderHistoryAnalysis }>>('/api/orders/analysis');
+      if (generation === this.orderCacheGeneration) {
+        this.orderAnalysisCache.set(cacheKey, response.data.data);
+      }
+      return response.data.data;
+    });
   }
 
   /**
-   * Reorder from a previous order
+   * Reorder from a previous order (adds its available items to the cart)
    */
   async reorderFromPrevious(orderId: string): Promise<CartResponse> {
-    const response = await this.client.post<ApiResponse<CartResponse>>(`/api/orders/reorder/${orderId}`);
+    const response = await this.client.post<ApiResponse<CartResponse>>(`/api/orders/${orderId}/reorder-to-cart`);
     return response.data.data;
   }
 }
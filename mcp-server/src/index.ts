@@ -20,6 +20,7 @@ import {
 } from '@modelcontextprotocol/sdk/types.js';
 
 import { toolDefinitions, handleToolCall } from './tools/index.js';
+import { apiClient } from './client/FlipkartAPIClient.js';
 import { logger } from './utils/logger.js';
 
 // Server metadata
@@ -59,12 +60,12 @@ function createServer(): Server {
     try {
       const result = await handleToolCall(name, args as Record<string, unknown> || {});
 
-      // Format response for MCP
+      // Format response for MCP (compact JSON - indentation only inflates the payload)
       return {
         content: [
           {
             type: 'text',
-            text: JSON.stringify(result, null, 2),
+            text: JSON.stringify(result),
           },
         ],
         isError: !result.success,
@@ -80,7 +81,7 @@ function createServer(): Server {
             text: JSON.stringify({
               success: false,
               message: `Tool execution failed: ${errorMessage}`,
-            }, null, 2),
+            }),
           },
         ],
         isError: true,
@@ -106,16 +107,25 @@ async function main() {
 
   logger.info('MCP Server running on stdio');
 
+  // Report backend reachability without holding up startup
+  apiClient.checkHealth().then((healthy) => {
+    if (!healthy) {
+      logger.warn('Flipkart API is not reachable; tool calls will fail until it is up');
+    }
+  });
+
   // Handle shutdown
   process.on('SIGINT', async () => {
     logger.info('Shutting down...');
     await server.close();
+    apiClient.close();
     process.exit(0);
   });
 
   process.on('SIGTERM', async () => {
     logger.info('Shutting down...');
     await server.close();
+    apiClient.close();
     process.exit(0);
   });
 }
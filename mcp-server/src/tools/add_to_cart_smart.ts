@@ -31,6 +31,10 @@ Requires: User must be logged in first (use login_user tool).`,
         type: 'number',
         description: 'Quantity to add (default: 1, max: 10)',
       },
+      product_name: {
+        type: 'string',
+        description: 'Product name from search_catalog results. Lets the tool skip re-fetching the product before adding.',
+      },
     },
     required: ['product_id'],
   },
@@ -78,52 +82,60 @@ export async function addToCartSmart(params: AddToCartParams): Promise<ToolRespo
       throw new Error('Quantity must be between 1 and 10');
     }
 
-    // First, get product details to check stock
-    let productName = 'Unknown Product';
-    try {
-      const productResult = await apiClient.getProduct(params.product_id);
-      productName = productResult.product.name;
+    // First, get product details to check stock. If the caller already knows the
+    // name and the product isn't cached, skip the lookup - the cart API still
+    // validates stock and the error path below offers alternatives.
+    let productName = params.product_name || 'Unknown Product';
+    const skipPreCheck = !!params.product_name && !apiClient.getCachedProduct(params.product_id);
+    if (!skipPreCheck) {
+      try {
+        const productResult = await apiClient.getProduct(params.product_id);
+        productName = productResult.product.name;
 
-      // Check if product is available
-      if (!productResult.product.isAvailable || productResult.product.stock < quantity) {
-        // Product is out of stock - fetch alternatives
-        logger.info(`Product ${productName} is out of stock, fetching alternatives`);
+        // Check if product is available
+        if (!productResult.product.isAvailable || productResult.product.stock < quantity) {
+          // Product is out of stock - fetch alternatives
+          logger.info(`Product ${productName} is out of stock, fetching alternatives`);
         
-        const alternatives = await apiClient.getAlternatives(params.product_id);
-        const formattedAlternatives = alternatives.alternatives
-          .filter(p => p.stock >= quantity && p.isAvailable)
-          .slice(0, 5)
-          .map(formatAlternative);
+          const alternatives = await apiClient.getAlternatives(params.product_id);
+          const formattedAlternatives = alternatives.alternatives
+            .filter(p => p.stock >= quantity && p.isAvailable)
+            .slice(0, 5)
+            .map(formatAlternative);
 
-        const response: ToolResponse = {
-          success: false,
-          message: `"${productName}" is currently out of stock or has insufficient quantity. Here are some alternatives:`,
-          requiresUserAction: true,
-          actionType: 'select_alternative',
-          data: {
-            original_product: {
-              product_id: params.product_id,
-              name: productName,
-              available_stock: productResult.product.stock,
-              requested_qty: quantity,
+          const response: ToolResponse = {
+            success: false,
+            message: `"${productName}" is currently out of stock or has insufficient quantity. Here are some alternatives:`,
+            requiresUserAction: true,
+            actionType: 'select_alternative',
+            data: {
+              original_product: {
+                product_id: params.product_id,
+                name: productName,
+                available_stock: productResult.product.stock,
+                requested_qty: quantity,
+              },
+              alternatives: formattedAlternatives,
             },
-            alternatives: formattedAlternatives,
-          },
-          options: formattedAlternatives,
-        };
+            options: formattedAlternatives,
+          };
 
-        logger.toolSuccess(requestId, 'add_to_cart_smart', response);
-        return response;
+          logger.toolSuccess(requestId, 'add_to_cart_smart', response);
+          return response;
+        }
+      } catch (error) {
+        // If product fetch fails, try to add anyway and let the cart API handle it
+        logger.warn(`Could not fetch product details: ${error instanceof Error ? error.message : 'Unknown error'}`);
       }
-    } catch (error) {
-      // If product fetch fails, try to add anyway and let the cart API handle it
-      logger.warn(`Could not fetch product details: ${error instanceof Error ? error.message : 'Unknown error'}`);
     }
 
     // Try to add to cart
     try {
       const cartResult = await apiClient.addToCart(params.product_id, quantity);
 
+      // Checkout usually comes next - warm the address list in the background
+      apiClient.prefetchAddresses();
+
       // Check for price changes after adding
       const priceCheck = await apiClient.priceCheck();
 
@@ -198,7 +210,13 @@ export async function addToCartSmart(params: AddToCartParams): Promise<ToolRespo
       return response;
 
     } catch (error) {
-      const errorMessage = error instanceof Error ? error.message : 'Failed to add to cart';
+      // The backend's reason (e.g. "Only 2 items available in stock") is in the
+      // axios response body, not in error.message
+      let errorMessage = error instanceof Error ? error.message : 'Failed to add to cart';
+      if (error && typeof error === 'object' && 'response' in error) {
+        const axiosError = error as { response?: { data?: { message?: string } } };
+        errorMessage = axiosError.response?.data?.message || errorMessage;
+      }
 
       // Check if it's a stock error
       if (errorMessage.includes('stock') || errorMessage.includes('available')) {
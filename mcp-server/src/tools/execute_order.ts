@@ -62,7 +62,8 @@ export async function executeOrder(params: ExecuteOrderParams): Promise<ToolResp
       throw new Error('Address ID is required. Use get_addresses to see available addresses.');
     }
 
-    // First, check if cart has items
+    // First, check if cart has items - before validating the address, so an empty
+    // cart gets this message and doesn't switch the active address
     const cart = await apiClient.getCart();
     if (cart.cart.items.length === 0) {
       return {
@@ -32,7 +32,8 @@ export {
 export {
   getOrderHistoryDefinition, getOrderHistory,
   reorderDefinition, reorder,
-  getLastOrderDefinition, getLastOrder
+  getLastOrderDefinition, getLastOrder,
+  trackOrderDefinition, trackOrder
 } from './order_history.js';
 export {
   getSmartSuggestionsDefinition, getSmartSuggestions
@@ -44,7 +45,7 @@ export {
   clearContextDefinition, clearContext
 } from './conversation.js';
 
-import type { ToolResponse, RecipeToCartParams, UnderstandIntentParams, ScheduleOrderParams, ReorderParams } from '../types/index.js';
+import type { ToolResponse, RecipeToCartParams, UnderstandIntentParams, ScheduleOrderParams, ReorderParams, TrackOrderParams } from '../types/index.js';
 
 // Import all definitions
 import { loginUserDefinition, loginUser } from './login_user.js';
@@ -75,7 +76,8 @@ import {
 import {
   getOrderHistoryDefinition, getOrderHistory,
   reorderDefinition, reorder,
-  getLastOrderDefinition, getLastOrder
+  getLastOrderDefinition, getLastOrder,
+  trackOrderDefinition, trackOrder
 } from './order_history.js';
 import {
   getSmartSuggestionsDefinition, getSmartSuggestions
@@ -115,6 +117,7 @@ export const toolDefinitions = [
   getOrderHistoryDefinition,
   reorderDefinition,
   getLastOrderDefinition,
+  trackOrderDefinition,
   // Smart Suggestions
   getSmartSuggestionsDefinition,
   // Conversation Management
@@ -131,7 +134,7 @@ export const toolHandlers: Record<string, ToolHandler> = {
   login_user: (params) => loginUser(params as { email: string; password: string }),
   logout_user: () => logoutUser(),
   search_catalog: (params) => searchCatalog(params as { query: string; qty_hint?: string }),
-  add_to_cart_smart: (params) => addToCartSmart(params as { product_id: string; qty: number }),
+  add_to_cart_smart: (params) => addToCartSmart(params as { product_id: string; qty: number; product_name?: string }),
   get_cart_bill: () => getCartBill(),
   get_addresses: () => getAddresses(),
   validate_location: (params) => validateLocation(params as { address_id: string }),
@@ -154,6 +157,7 @@ export const toolHandlers: Record<string, ToolHandler> = {
   get_order_history: (params) => getOrderHistory(params as { include_analysis?: boolean; limit?: number }),
   reorder: (params) => reorder(params as unknown as ReorderParams),
   get_last_order: () => getLastOrder(),
+  track_order: (params) => trackOrder(params as unknown as TrackOrderParams),
   // Smart Suggestions
   get_smart_suggestions: (params) => getSmartSuggestions(params as { context?: string }),
   // Conversation Management
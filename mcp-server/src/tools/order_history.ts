@@ -5,12 +5,14 @@
 
 import { apiClient } from '../client/FlipkartAPIClient.js';
 import { logger } from '../utils/logger.js';
-import type { ToolResponse, ReorderParams } from '../types/index.js';
+import type { ToolResponse, ReorderParams, TrackOrderParams, OrderStatusResponse } from '../types/index.js';
 
 // ============================================
 // Get Order History Tool
 // ============================================
 
+const MAX_ORDER_HISTORY_LIMIT = 500;
+
 export const getOrderHistoryDefinition = {
   name: 'get_order_history',
   description: `Get the user's order history with optional analysis.
@@ -31,7 +33,7 @@ Requires: User must be logged in first (use login_user tool).`,
       },
       limit: {
         type: 'number',
-        description: 'Maximum number of orders to return (default: 10)',
+        description: `Maximum number of orders to return (default: 10, max: ${MAX_ORDER_HISTORY_LIMIT})`,
       },
     },
     required: [],
@@ -53,8 +55,9 @@ export async function getOrderHistory(params: { include_analysis?: boolean; limi
     const includeAnalysis = params.include_analysis !== false;
     
     // Get order history
-    const historyResult = await apiClient.getOrderHistory();
-    const orders = historyResult.orders.slice(0, params.limit || 10);
+    const limit = Math.min(Math.max(params.limit || 10, 1), MAX_ORDER_HISTORY_LIMIT);
+    const historyResult = await apiClient.getOrderHistory(limit);
+    const orders = historyResult.orders;
 
     if (orders.length === 0) {
       return {
@@ -173,6 +176,7 @@ export async function reorder(params: ReorderParams): Promise<ToolResponse> {
 
     // Reorder to cart
     const result = await apiClient.reorderFromPrevious(params.order_id);
+    apiClient.prefetchAddresses();
 
     const addedCount = result.cart.items.length;
     const totalAmount = result.bill.totalAmount;
@@ -248,7 +252,7 @@ export async function getLastOrder(): Promise<ToolResponse> {
     }
 
     // Get order history (just the first one)
-    const historyResult = await apiClient.getOrderHistory();
+    const historyResult = await apiClient.getOrderHistory(1);
     
     if (historyResult.orders.length === 0) {
       return {
@@ -299,3 +303,157 @@ export async function getLastOrder(): Promise<ToolResponse> {
     };
   }
 }
+
+// ============================================
+// Track Order Tool
+// ============================================
+
+// Well under the MCP SDK's 60s default client request timeout, leaving room
+// for the initial fetches and the final poll
+const MAX_TRACK_WAIT_SECS = 30;
+const TRACK_POLL_INTERVAL_MS = 3000;
+const FINAL_ORDER_STATUSES = ['delivered', 'cancelled'];
+
+function statusSignature(status: OrderStatusResponse): string {
+  return `${status.currentStatus}|${status.statusHistory.length}|${status.liveUpdate?.message || ''}`;
+}
+
+/**
+ * Poll order status until it changes or the wait window closes
+ * Keeps the polling loop server-side so a waiting agent makes one tool call
+ */
+async function waitForStatusChange(orderId: string, initial: OrderStatusResponse, waitSecs: number): Promise<OrderStatusResponse> {
+  const deadline = Date.now() + waitSecs * 1000;
+  const initialSignature = statusSignature(initial);
+  let status = initial;
+
+  while (!FINAL_ORDER_STATUSES.includes(status.currentStatus) && Date.now() < deadline) {
+    const delay = Math.min(TRACK_POLL_INTERVAL_MS, deadline - Date.now());
+    await new Promise(resolve => setTimeout(resolve, delay));
+    try {
+      status = await apiClient.getOrderStatus(orderId);
+    } catch (error) {
+      // A failed poll shouldn't discard the wait - report the last known status
+      logger.debug(`Order status poll failed: ${error instanceof Error ? error.message : String(error)}`);
+      break;
+    }
+    if (statusSignature(status) !== initialSignature) break;
+  }
+
+  return status;
+}
+
+export const trackOrderDefinition = {
+  name: 'track_order',
+  description: `Get full details and live delivery status of an order in one call.
+
+Returns:
+- Order items, bill and delivery address
+- Current status, payment status and delivery countdown
+- Status history and live rider updates (when out for delivery)
+
+Use this when user asks "where is my order" or wants order details.
+To follow a delivery, set wait_for_update_secs instead of calling this repeatedly:
+the call returns as soon as the status or rider update changes.
+Requires: User must be logged in first (use login_user tool).`,
+  inputSchema: {
+    type: 'object' as const,
+    properties: {
+      order_id: {
+        type: 'string',
+        description: 'The order ID to track (from get_order_history or get_last_order)',
+      },
+      wait_for_update_secs: {
+        type: 'number',
+        description: `Wait up to this many seconds for the status to change before returning (max ${MAX_TRACK_WAIT_SECS}, default: 0 - return immediately)`,
+      },
+    },
+    required: ['order_id'],
+  },
+};
+
+export async function trackOrder(params: TrackOrderParams): Promise<ToolResponse> {
+  const requestId = logger.toolStart('track_order', params);
+
+  try {
+    // Check authentication
+    if (!apiClient.isAuthenticated()) {
+      return {
+        success: false,
+        message: 'Please login first using the login_user tool to track your order.',
+      };
+    }
+
+    if (!params.order_id) {
+      return {
+        success: false,
+        message: 'Order ID is required. Use get_order_history to see your past orders.',
+      };
+    }
+
+    // Order details and status are independent - fetch both concurrently
+    const [orderResult, initialStatus] = await Promise.all([
+      apiClient.getOrder(params.order_id),
+      apiClient.getOrderStatus(params.order_id),
+    ]);
+    const order = orderResult.order;
+
+    const waitSecs = Math.min(Math.max(params.wait_for_update_secs || 0, 0), MAX_TRACK_WAIT_SECS);
+    const status = waitSecs > 0
+      ? await waitForStatusChange(params.order_id, initialStatus, waitSecs)
+      : initialStatus;
+
+    let etaNote = '';
+    if (status.liveUpdate?.message) {
+      etaNote = ` ${status.liveUpdate.message}.`;
+    } else if (status.deliveryCountdown) {
+      etaNote = ` Arriving in about ${status.deliveryCountdown.minutes} min.`;
+    }
+
+    const response: ToolResponse = {
+      success: true,
+      message: `Order #${order.orderNumber} is ${status.currentStatus.replace(/_/g, ' ')}.${etaNote} Total: ₹${order.totalAmount}.`,
+      data: {
+        order: {
+          order_id: order._id,
+          order_number: order.orderNumber,
+          total_amount: order.totalAmount,
+          payment_mode: status.paymentMode,
+          payment_status: status.paymentStatus,
+          items: order.items.map(item => ({
+            name: item.name,
+            quantity: item.quantity,
+            price: item.price,
+            total: item.total,
+          })),
+          address: `${order.address.addressLine1}, ${order.address.city} - ${order.address.pincode}`,
+        },
+        tracking: {
+          status: status.currentStatus,
+          estimated_delivery: status.estimatedDelivery,
+          delivery_countdown: status.deliveryCountdown,
+          delivered_at: status.deliveredAt,
+          live_update: status.liveUpdate,
+          changed: waitSecs > 0 ? statusSignature(status) !== statusSignature(initialStatus) : undefined,
+          history: status.statusHistory.map(update => ({
+            status: update.status,
+            message: update.message,
+            timestamp: update.timestamp,
+          })),
+        },
+      },
+    };
+
+    logger.toolSuccess(requestId, 'track_order', response);
+    return response;
+
+  } catch (error) {
+    const errorMessage = error instanceof Error ? error.message : 'Failed to track order';
+    logger.toolError(requestId, 'track_order', errorMessage);
+
+    return {
+      success: false,
+      message: `Failed to track order: ${errorMessage}`,
+    };
+  }
+}
@@ -237,8 +237,14 @@ export async function recipeToCart(params: RecipeToCartParams & { add_to_cart?:
     let estimatedTotal = 0;
     let maxDeliveryTime = 0;
 
-    for (const ingredient of scaledRecipe.ingredients) {
-      const product = await findProductForIngredient(ingredient.searchQuery);
+    // Look up every ingredient concurrently; substitutes are only searched
+    // for the few that come back unavailable
+    const matchedProducts = await Promise.all(
+      scaledRecipe.ingredients.map(ingredient => findProductForIngredient(ingredient.searchQuery))
+    );
+
+    for (const [index, ingredient] of scaledRecipe.ingredients.entries()) {
+      const product = matchedProducts[index];
       
       if (!product) {
         unavailableItems.push({
@@ -350,6 +356,7 @@ export async function recipeToCart(params: RecipeToCartParams & { add_to_cart?:
           }));
         
         const cartResult = await apiClient.bulkAddToCart(itemsToAdd);
+        apiClient.prefetchAddresses();
         
         response.message = `Added ${cartResult.successItems.length} items for "${scaledRecipe.name}" to cart. ` +
           `Cart total: ₹${cartResult.bill.totalAmount}`;
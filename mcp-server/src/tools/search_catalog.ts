@@ -55,6 +55,10 @@ interface FormattedProduct {
   };
 }
 
+function discountPercent(price: number, mrp: number): number {
+  return mrp > price ? Math.round(((mrp - price) * 100) / mrp) : 0;
+}
+
 function formatProduct(product: Product): FormattedProduct {
   const formatted: FormattedProduct = {
     product_id: product._id,
@@ -62,7 +66,7 @@ function formatProduct(product: Product): FormattedProduct {
     brand: product.brand,
     price: product.price,
     mrp: product.mrp,
-    discount_percent: product.discountPercent || Math.round(((product.mrp - product.price) / product.mrp) * 100),
+    discount_percent: product.discountPercent || discountPercent(product.price, product.mrp),
     unit: product.unit,
     rating: product.rating,
     review_count: product.reviewCount,
@@ -45,6 +45,8 @@ const COMPLEMENTARY_PRODUCTS: Record<string, string[]> = {
   'milk': ['bread', 'cornflakes', 'oats'],
 };
 
+const COMPLEMENTARY_ENTRIES = Object.entries(COMPLEMENTARY_PRODUCTS);
+
 function getTimeOfDay(): string {
   const hour = new Date().getHours();
   if (hour >= 5 && hour < 11) return 'morning';
@@ -60,6 +62,36 @@ function getDayContext(): { isWeekend: boolean; dayName: string } {
   return { isWeekend, dayName };
 }
 
+type SuggestedProduct = { productId: string; name: string; price: number; unit: string; reason: string };
+
+/**
+ * Search for the top product of each query concurrently
+ * Failed searches and products excluded by dietary preference are skipped
+ */
+async function findTopProducts(queries: string[], reason: string, dietaryPreference?: string | null): Promise<SuggestedProduct[]> {
+  const results = await Promise.all(
+    queries.map(query => apiClient.smartSearch(query).catch(() => null))
+  );
+
+  const products: SuggestedProduct[] = [];
+  for (const result of results) {
+    const product = result?.products[0];
+    if (!product) continue;
+    // Filter by dietary preference if set
+    if (dietaryPreference === 'veg' && product.dietaryPreference === 'non_veg') {
+      continue;
+    }
+    products.push({
+      productId: product._id,
+      name: product.name,
+      price: product.price,
+      unit: product.unit,
+      reason,
+    });
+  }
+  return products;
+}
+
 export const getSmartSuggestionsDefinition = {
   name: 'get_smart_suggestions',
   description: `Get intelligent, context-aware product suggestions.
@@ -141,29 +173,11 @@ export async function getSmartSuggestions(params: { context?: string }): Promise
         
         if (productsToSuggest.length > 0) {
           // Search for actual products
-          const productResults: Array<{ productId: string; name: string; price: number; unit: string; reason: string }> = [];
-          
-          for (const query of productsToSuggest.slice(0, 3)) {
-            try {
-              const result = await apiClient.smartSearch(query);
-              if (result.products.length > 0) {
-                const product = result.products[0];
-                // Filter by dietary preference if set
-                if (userPreferences?.dietaryPreference === 'veg' && product.dietaryPreference === 'non_veg') {
-                  continue;
-                }
-                productResults.push({
-                  productId: product._id,
-                  name: product.name,
-                  price: product.price,
-                  unit: product.unit,
-                  reason: `Popular ${timeOfDay} item`,
-                });
-              }
-            } catch {
-              // Skip if search fails
-            }
-          }
+          const productResults = await findTopProducts(
+            productsToSuggest.slice(0, 3),
+            `Popular ${timeOfDay} item`,
+            userPreferences?.dietaryPreference
+          );
           
           if (productResults.length > 0) {
             suggestions.push({
@@ -179,43 +193,27 @@ export async function getSmartSuggestions(params: { context?: string }): Promise
 
     // 2. Cart-based complementary suggestions
     if ((contextType === 'all' || contextType === 'cart_based') && cartItems.length > 0) {
-      const complementaryItems: Set<string> = new Set();
+      // Collect complements of matching cart items first, then check each
+      // distinct candidate against the cart once
+      const candidates: Set<string> = new Set();
       
       for (const cartItem of cartItems) {
-        for (const [key, complements] of Object.entries(COMPLEMENTARY_PRODUCTS)) {
+        for (const [key, complements] of COMPLEMENTARY_ENTRIES) {
           if (cartItem.includes(key)) {
-            complements.forEach(c => {
-              if (!cartItems.some(ci => ci.includes(c))) {
-                complementaryItems.add(c);
-              }
-            });
+            complements.forEach(c => candidates.add(c));
           }
         }
       }
+
+      const complementaryItems = Array.from(candidates)
+        .filter(c => !cartItems.some(ci => ci.includes(c)));
       
-      if (complementaryItems.size > 0) {
-        const productResults: Array<{ productId: string; name: string; price: number; unit: string; reason: string }> = [];
-        
-        for (const query of Array.from(complementaryItems).slice(0, 3)) {
-          try {
-            const result = await apiClient.smartSearch(query);
-            if (result.products.length > 0) {
-              const product = result.products[0];
-              if (userPreferences?.dietaryPreference === 'veg' && product.dietaryPreference === 'non_veg') {
-                continue;
-              }
-              productResults.push({
-                productId: product._id,
-                name: product.name,
-                price: product.price,
-                unit: product.unit,
-                reason: 'Goes well with items in your cart',
-              });
-            }
-          } catch {
-            // Skip if search fails
-          }
-        }
+      if (complementaryItems.length > 0) {
+        const productResults = await findTopProducts(
+          complementaryItems.slice(0, 3),
+          'Goes well with items in your cart',
+          userPreferences?.dietaryPreference
+        );
         
         if (productResults.length > 0) {
           suggestions.push({
@@ -247,6 +247,48 @@ export interface CreateOrderResponse {
   order: Order;
 }
 
+export interface OrderStatusUpdate {
+  status: string;
+  message?: string;
+  timestamp?: string;
+  riderName?: string;
+  riderPhone?: string;
+  riderProximityKm?: number;
+  estimatedMinutes?: number;
+}
+
+export interface OrderStatusResponse {
+  orderId: string;
+  orderNumber: string;
+  currentStatus: Order['orderStatus'];
+  paymentStatus: Order['paymentStatus'];
+  paymentMode: Order['paymentMode'];
+  estimatedDelivery: string | null;
+  deliveryCountdown: { minutes: number; seconds: number } | null;
+  deliveredAt: string | null;
+  statusHistory: OrderStatusUpdate[];
+  liveUpdate: OrderStatusUpdate | null;
+}
+
+export interface OrderHistoryResponse {
+  orders: Array<{
+    _id: string;
+    orderNumber: string;
+    orderStatus: Order['orderStatus'];
+    totalAmount: number;
+    createdAt: string;
+  }>;
+}
+
+export interface OrderHistoryPageResponse extends OrderHistoryResponse {
+  pagination: {
+    page: number;
+    limit: number;
+    total: number;
+    pages: number;
+  };
+}
+
 export interface PaymentResponse {
   orderId: string;
   orderNumber: string;
@@ -521,6 +563,7 @@ export interface SearchCatalogParams {
 export interface AddToCartParams {
   product_id: string;
   qty: number;
+  product_name?: string;
 }
 
 export interface ValidateLocationParams {
@@ -560,6 +603,11 @@ export interface ReorderParams {
   order_id: string;
 }
 
+export interface TrackOrderParams {
+  order_id: string;
+  wait_for_update_secs?: number;
+}
+
 // ============================================
 // Tool Response Types
 // ============================================
@@ -0,0 +1,68 @@
+/**
+ * In-memory TTL Cache
+ * Short-lived key/value store for API data that is safe to reuse briefly
+ * Evicts the least recently used entry once the size cap is reached
+ */
+
+interface CacheEntry<V> {
+  value: V;
+  expiresAt: number;
+}
+
+export class TtlCache<K, V> {
+  private entries: Map<K, CacheEntry<V>> = new Map();
+
+  constructor(private ttlMs: number, private maxEntries: number = 500) {}
+
+  /**
+   * Get a cached value, or undefined if missing or expired
+   */
+  get(key: K): V | undefined {
+    const entry = this.entries.get(key);
+    if (!entry) return undefined;
+
+    this.entries.delete(key);
+    if (Date.now() > entry.expiresAt) {
+      return undefined;
+    }
+
+    // Re-insert to mark as most recently used
+    this.entries.set(key, entry);
+    return entry.value;
+  }
+
+  /**
+   * Store a value for the configured TTL
+   */
+  set(key: K, value: V): void {
+    // Re-inserting moves the key to the end of the eviction order
+    this.entries.delete(key);
+
+    if (this.entries.size >= this.maxEntries) {
+      const oldest = this.entries.keys().next().value;
+      if (oldest !== undefined) {
+        this.entries.delete(oldest);
+      }
+    }
+
+    this.entries.set(key, { value, expiresAt: Date.now() + this.ttlMs });
+  }
+
+  /**
+   * Unexpired values, without affecting eviction order
+   */
+  *values(): IterableIterator<V> {
+    const now = Date.now();
+    for (const entry of this.entries.values()) {
+      if (now <= entry.expiresAt) yield entry.value;
+    }
+  }
+
+  delete(key: K): void {
+    this.entries.delete(key);
+  }
+
+  clear(): void {
+    this.entries.clear();
+  }
+}
@@ -5,6 +5,13 @@
 
 type LogLevel = 'debug' | 'info' | 'warn' | 'error';
 
+const LEVEL_PRIORITY: Record<LogLevel, number> = {
+  debug: 0,
+  info: 1,
+  warn: 2,
+  error: 3,
+};
+
 interface LogEntry {
   timestamp: string;
   level: LogLevel;
@@ -16,22 +23,28 @@ interface LogEntry {
 }
 
 class Logger {
-  private logLevel: LogLevel;
+  private minPriority: number;
   private startTimes: Map<string, number> = new Map();
 
   constructor() {
-    const level = process.env.MCP_LOG_LEVEL || 'debug';
-    this.logLevel = this.parseLogLevel(level);
+    // Default to info: debug pretty-prints every API payload to stderr
+    const level = process.env.MCP_LOG_LEVEL || 'info';
+    this.minPriority = LEVEL_PRIORITY[this.parseLogLevel(level)];
   }
 
   private parseLogLevel(level: string): LogLevel {
-    const validLevels: LogLevel[] = ['debug', 'info', 'warn', 'error'];
-    return validLevels.includes(level as LogLevel) ? (level as LogLevel) : 'debug';
+    return Object.hasOwn(LEVEL_PRIORITY, level) ? (level as LogLevel) : 'info';
   }
 
   private shouldLog(level: LogLevel): boolean {
-    const levels: LogLevel[] = ['debug', 'info', 'warn', 'error'];
-    return levels.indexOf(level) >= levels.indexOf(this.logLevel);
+    return LEVEL_PRIORITY[level] >= this.minPriority;
+  }
+
+  /**
+   * Check whether a level is enabled, so callers can skip building log data
+   */
+  isEnabled(level: LogLevel): boolean {
+    return this.shouldLog(level);
   }
 
   private formatLog(entry: LogEntry): string {
@@ -119,9 +132,10 @@ class Logger {
     const duration = startTime ? Date.now() - startTime : undefined;
     this.startTimes.delete(requestId);
 
+    // The result is serialized again for the MCP response, so only dump it when debugging
     this.log('info', 'Tool call completed', {
       tool: toolName,
-      data: { result },
+      data: this.shouldLog('debug') ? { result } : undefined,
       duration,
     });
   }
@@ -32,11 +32,16 @@ interface StoredAuth {
   expiresAt?: number;
 }
 
+// Derived key is memoized - scryptSync is deliberately slow and blocks the event loop
+let cachedKey: Buffer | null = null;
+
 /**
  * Get or create encryption key
  * The key is derived from a random secret stored separately
  */
 function getEncryptionKey(): Buffer {
+  if (cachedKey) return cachedKey;
+
   try {
     // Ensure storage directory exists
     if (!existsSync(STORAGE_DIR)) {
@@ -55,7 +60,8 @@ function getEncryptionKey(): Buffer {
 
     // Derive key using scrypt
     const salt = Buffer.from('flipkart-minutes-mcp-salt');
-    return scryptSync(secret, salt, 32);
+    cachedKey = scryptSync(secret, salt, 32);
+    return cachedKey;
   } catch (error) {
     logger.error('Failed to get encryption key', error instanceof Error ? error : String(error));
     throw new Error('Failed to initialize secure storage');
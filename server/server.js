@@ -32,6 +32,13 @@ const app = express();
 const httpServer = createServer(app);
 const PORT = process.env.PORT || 5000;
 
+// Keep idle connections open long enough for the MCP server to reuse them
+// between tool calls (Node's default is 5s). Clients should idle out first;
+// the MCP server's FLIPKART_API_KEEPALIVE_SECS defaults to 70s
+const KEEP_ALIVE_TIMEOUT_MS = (Number(process.env.KEEP_ALIVE_TIMEOUT_SECS) || 75) * 1000;
+httpServer.keepAliveTimeout = KEEP_ALIVE_TIMEOUT_MS;
+httpServer.headersTimeout = KEEP_ALIVE_TIMEOUT_MS + 1000;
+
 // Middleware
 app.use(cors({
   origin: process.env.CLIENT_URL || 'http://localhost:5173',
@@ -20,10 +20,12 @@ export const getOrderHistory = asyncHandler(async (req, res) => {
   const skip = (page - 1) * limit;
 
   const [orders, total] = await Promise.all([
+    // Read-only listing: lean() skips hydrating full Mongoose documents
     Order.find({ userId: req.user._id })
       .sort({ createdAt: -1 })
       .skip(skip)
-      .limit(limit),
+      .limit(limit)
+      .lean(),
     Order.countDocuments({ userId: req.user._id })
   ]);
 
@@ -45,7 +47,7 @@ export const getOrderHistory = asyncHandler(async (req, res) => {
 // @route   GET /api/orders/:id
 // @access  Private
 export const getOrder = asyncHandler(async (req, res) => {
-  const order = await Order.findOne({ _id: req.params.id, userId: req.user._id });
+  const order = await Order.findOne({ _id: req.params.id, userId: req.user._id }).lean();
 
   if (!order) {
     throw new AppError('Order not found', 404);
@@ -233,7 +235,7 @@ export const cancelOrder = asyncHandler(async (req, res) => {
 // @route   POST /api/orders/:id/reorder
 // @access  Private
 export const reorder = asyncHandler(async (req, res) => {
-  const order = await Order.findOne({ _id: req.params.id, userId: req.user._id });
+  const order = await Order.findOne({ _id: req.params.id, userId: req.user._id }).lean();
 
   if (!order) {
     throw new AppError('Order not found', 404);
@@ -241,13 +243,16 @@ export const reorder = asyncHandler(async (req, res) => {
 
   // Check product availability
   const productIds = order.items.map(item => item.productId);
-  const products = await Product.find({ _id: { $in: productIds }, isAvailable: true });
+  const products = await Product.find({ _id: { $in: productIds }, isAvailable: true })
+    .select('name image unit price stock')
+    .lean();
+  const productMap = new Map(products.map(p => [p._id.toString(), p]));
   
   const availableItems = [];
   const unavailableItems = [];
 
   for (const item of order.items) {
-    const product = products.find(p => p._id.toString() === item.productId.toString());
+    const product = productMap.get(item.productId.toString());
     if (product && product.stock >= item.quantity) {
       availableItems.push({
         productId: product._id,
@@ -283,8 +288,8 @@ export const reorder = asyncHandler(async (req, res) => {
 export const getOrderAnalysis = asyncHandler(async (req, res) => {
   const userId = req.user._id;
   
-  // Get all orders for analysis
-  const orders = await Order.find({ userId }).sort({ createdAt: -1 });
+  // Get all orders for analysis (plain objects - only read below)
+  const orders = await Order.find({ userId }).sort({ createdAt: -1 }).lean();
   
   if (orders.length === 0) {
     return res.json({
@@ -3,6 +3,22 @@ import Product from '../models/Product.model.js';
 import { DIETARY_PREFERENCE } from '../config/constants.js';
 import { asyncHandler } from '../middleware/error.middleware.js';
 
+/**
+ * Key with the highest count in a tally object (first key wins ties)
+ * Linear scan - avoids sorting the whole tally just to read the top entry
+ */
+function topKey(counts) {
+  let best = null;
+  let bestCount = -Infinity;
+  for (const [key, count] of Object.entries(counts)) {
+    if (count > bestCount) {
+      best = key;
+      bestCount = count;
+    }
+  }
+  return best;
+}
+
 /**
  * Analyze order history to derive all user preferences
  * No separate preferences table - everything comes from orders
@@ -139,8 +155,7 @@ async function analyzeOrderHistory(userId, orderLimit = 25) {
   }
   
   // Preferred payment method
-  const preferredPaymentMethod = Object.entries(paymentCounts)
-    .sort((a, b) => b[1] - a[1])[0]?.[0] || null;
+  const preferredPaymentMethod = topKey(paymentCounts);
   
   // Preferred brands (top 5)
   const preferredBrands = Object.entries(brandCounts)
@@ -154,8 +169,7 @@ async function analyzeOrderHistory(userId, orderLimit = 25) {
     .slice(0, 2)
     .map(([day]) => day);
   
-  const preferredTime = Object.entries(timeCount)
-    .sort((a, b) => b[1] - a[1])[0]?.[0] || 'evening';
+  const preferredTime = topKey(timeCount) || 'evening';
   
   const averageOrderValue = orders.length > 0 ? Math.round(totalValue / orders.length) : 0;
   
@@ -350,10 +350,12 @@ export const smartSearch = asyncHandler(async (req, res) => {
     stock: { $gt: 0 }
   };
 
+  // Lean queries: results are re-shaped below, so skip Mongoose document hydration
   let products = await Product.find(searchQuery, { score: { $meta: 'textScore' } })
     .sort({ score: { $meta: 'textScore' } })
     .limit(limit * 2) // Get more to filter/sort later
-    .populate('categoryId', 'name slug');
+    .populate('categoryId', 'name slug')
+    .lean();
 
   // If no text search results, try regex search
   if (products.length === 0) {
@@ -369,7 +371,8 @@ export const smartSearch = asyncHandler(async (req, res) => {
     products = await Product.find(regexQuery)
       .sort({ rating: -1 })
       .limit(limit * 2)
-      .populate('categoryId', 'name slug');
+      .populate('categoryId', 'name slug')
+      .lean();
   }
 
   // Calculate max price for normalization
@@ -377,7 +380,12 @@ export const smartSearch = asyncHandler(async (req, res) => {
 
   // Add weighted scores and quantity match info
   let scoredProducts = products.map(product => {
-    const productObj = product.toObject();
+    // Lean docs carry no virtuals - add the ones the document form exposed
+    const productObj = {
+      ...product,
+      id: product._id.toString(),
+      discountPercent: Product.calculateDiscountPercent(product.mrp, product.price)
+    };
     productObj.weightedScore = calculateWeightedScore(product, maxPrice);
     
     // Check quantity match
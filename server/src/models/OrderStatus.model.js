@@ -74,7 +74,7 @@ orderStatusSchema.statics.getLatestStatus = async function(orderId) {
 
 // Get full status history for an order
 orderStatusSchema.statics.getStatusHistory = async function(orderId) {
-  return this.find({ orderId }).sort({ createdAt: 1 });
+  return this.find({ orderId }).sort({ createdAt: 1 }).lean();
 };
 
 const OrderStatus = mongoose.model('OrderStatus', orderStatusSchema);
@@ -101,12 +101,19 @@ const productSchema = new mongoose.Schema({
   timestamps: true
 });
 
-// Calculate discount percentage virtual
-productSchema.virtual('discountPercent').get(function() {
-  if (this.mrp > this.price) {
-    return Math.round(((this.mrp - this.price) / this.mrp) * 100);
+// Discount percentage off MRP - shared by the virtual and lean query results
+function calculateDiscountPercent(mrp, price) {
+  if (mrp > price) {
+    return Math.round(((mrp - price) / mrp) * 100);
   }
   return 0;
+}
+
+productSchema.statics.calculateDiscountPercent = calculateDiscountPercent;
+
+// Calculate discount percentage virtual
+productSchema.virtual('discountPercent').get(function() {
+  return calculateDiscountPercent(this.mrp, this.price);
 });
 
 // Ensure virtuals are included in JSON